@@ -9,24 +9,40 @@ The application uses SQLAlchemy for database operations and implements
 CORS protection for secure communication with the frontend.
 """
 
+import logging
+import os
+import time
+
+from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import Literal
+import jwt
+
+# Load environment variables from .env file once, before app modules read
+# them at import time. In production the orchestrator injects them.
+if os.environ.get("ENV") != "prod":
+    load_dotenv()
 
 from app.routers import auth, workouts
 from app.database import Base, engine
+from app.deps import ALGORITHM, SECRET_KEY, password_context
+
+logger = logging.getLogger(__name__)
+
+# Acceptable mean password hash time in seconds for the configured cost
+HASH_TARGET_RANGE = (0.1, 0.4)
 
 
 # Initialize FastAPI application
 app = FastAPI(
     title="Workout Tracking API",
     description="API for tracking workouts and managing user authentication",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 # Configure CORS middleware
 # This allows the frontend (running on localhost:3000) to make requests to our API
 app.add_middleware(
@@ -38,6 +54,59 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def create_tables() -> None:
+    """
+    Create missing database tables when RUN_MIGRATIONS=1.
+
+    Skipped by default so regular worker boots do not issue schema
+    reflection queries against the database.
+    """
+    if os.getenv("RUN_MIGRATIONS") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+
+@app.on_event("startup")
+def warm_up_auth() -> None:
+    """
+    Initialize the password hashing and JWT code paths before serving
+    requests.
+
+    passlib loads its hashing backends lazily, so without this the first
+    login after a worker boot pays the backend setup on top of the hash.
+    Building the dummy hash used for unknown usernames here also primes its
+    cache. Runs before check_password_hash_cost so the one-off setup does
+    not skew the timing.
+    """
+    auth.dummy_password_hash()
+    token = jwt.encode({"sub": "warmup"}, SECRET_KEY, algorithm=ALGORITHM)
+    jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+@app.on_event("startup")
+def check_password_hash_cost() -> None:
+    """
+    Measure the password hash time for the configured cost on this host.
+
+    Logs a warning when the mean of three hashes falls outside
+    HASH_TARGET_RANGE, hinting that the ARGON2_* settings should be adjusted.
+    """
+    samples = 3
+    start = time.perf_counter()
+    for _ in range(samples):
+        password_context.hash("calibration")
+    mean = (time.perf_counter() - start) / samples
+
+    low, high = HASH_TARGET_RANGE
+    if not low <= mean <= high:
+        logger.warning(
+            "Password hashing takes %.0fms per hash (target %.0f-%.0fms); "
+            "consider adjusting ARGON2_TIME_COST or ARGON2_MEMORY_COST",
+            mean * 1000, low * 1000, high * 1000
+        )
+
+
 @app.get("/", response_model=Literal["Health Check Complete"])
 async def health_check() -> str:
     """
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, Table
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -56,10 +56,13 @@ class Workout(Base):
         routines (relationship): Many-to-many relationship with Routine model
     """
     __tablename__ = "workouts"
+    # Per-user lookups filter on user_id (and id); the composite index also
+    # serves plain user_id filters through its leftmost column
+    __table_args__ = (Index("ix_workouts_user_id_id", "user_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
-    description = Column(String, index=True)
+    description = Column(String)
     duration = Column(Integer)  # Duration in minutes
     date = Column(String)  # Date in YYYY-MM-DD format
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -1,23 +1,29 @@
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import timedelta
+from functools import cache
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from sqlalchemy import Row, insert, select, update
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import jwt 
-from dotenv import load_dotenv
-import os
+import jwt
 from ..models import User
-from ..deps import db_dependency, bcrypt_context
-
-load_dotenv()
+from ..deps import (
+    ALGORITHM,
+    SECRET_KEY,
+    db_dependency,
+    invalidate_cached_user,
+    password_context,
+)
 
 router = APIRouter(
     prefix="/auth",
     tags=["auth"],  # Tags for grouping routes in the OpenAPI documentation
 )
 
-SECRET_KEY = os.getenv("AUTH_SECRET_KEY")
-ALGORITHM = os.getenv("AUTH_ALGORITHM")
+# Token lifetime in seconds when create_access_token gets no expires_delta
+DEFAULT_TOKEN_EXPIRE_SECONDS = 15 * 60
 
 class UserCreateRequest(BaseModel):
     """
@@ -49,27 +55,57 @@ class Token(BaseModel):
     token_type: str
 
 
-def authenticate_user(username: str, password: str, db: db_dependency) -> User | bool:
+@cache
+def dummy_password_hash() -> str:
+    """Return a hash at the configured cost for verifying unknown users."""
+    return password_context.hash("dummy-password")
+
+
+async def authenticate_user(username: str, password: str, db: db_dependency) -> Row | bool:
     """
     Authenticates a user by username and password.
 
     This function checks if a user with the given username exists in the
-    database and verifies the password. Returns the user object if authentication
-    is successful, False otherwise.
+    database and verifies the password. Only the id, username and password
+    hash are loaded. Returns that row if authentication is successful, False
+    otherwise. The hash check runs in a worker thread so it does not block
+    the event loop. Unknown usernames are checked against a dummy hash so
+    response timing does not reveal which usernames exist. Hashes made with
+    a deprecated scheme or outdated cost are replaced after a successful
+    check.
 
     Args:
         username (str): The username to authenticate
         password (str): The password to verify
-        db (Session): SQLAlchemy database session object
+        db (AsyncSession): SQLAlchemy async database session object
 
     Returns:
-        Union[User, bool]: The authenticated user object if successful, False otherwise
+        Union[Row, bool]: The authenticated user row if successful, False otherwise
     """
-    user = db.query(User).filter(User.username == username).first()
+    result = await db.execute(
+        select(User.id, User.username, User.hashed_password).where(
+            User.username == username
+        )
+    )
+    user = result.first()
     if not user:
+        await run_in_threadpool(
+            password_context.verify, password, dummy_password_hash()
+        )
         return False
-    if not bcrypt_context.verify(password, user.hashed_password):
+    verified, new_hash = await run_in_threadpool(
+        password_context.verify_and_update, password, user.hashed_password
+    )
+    if not verified:
         return False
+    if new_hash is not None:
+        await db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(hashed_password=new_hash)
+        )
+        await db.commit()
+        invalidate_cached_user(user.id)
     return user
 
 
@@ -89,12 +125,16 @@ def create_access_token(username: str, user_id: int, expires_delta: timedelta |
     Returns:
         str: The generated JWT access token
     """
-    to_encode = {"sub": username, "id": user_id}
+    # JWT "exp" is plain epoch seconds, so skip building datetime objects
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        lifetime = expires_delta.total_seconds()
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
+        lifetime = DEFAULT_TOKEN_EXPIRE_SECONDS
+    to_encode = {
+        "sub": username,
+        "id": user_id,
+        "exp": int(time.time() + lifetime)
+    }
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -109,7 +149,7 @@ async def create_user(db: db_dependency, create_user_request: UserCreateRequest)
     it returns a 201 status code.
 
     Args:
-        db (Session): SQLAlchemy database session object
+        db (AsyncSession): SQLAlchemy async database session object
         create_user_request (UserCreateRequest): Request model for creating a new user
 
     Returns:
@@ -118,14 +158,21 @@ async def create_user(db: db_dependency, create_user_request: UserCreateRequest)
     Raises:
         HTTPException: If the username already exists in the database
     """
-    create_user_model = User(
-        username=create_user_request.username,
-        hashed_password=bcrypt_context.hash(create_user_request.password)
+    # Hashing is CPU-bound; run it off the event loop to keep other requests moving
+    hashed_password = await run_in_threadpool(
+        password_context.hash, create_user_request.password
+    )
+    result = await db.execute(
+        insert(User)
+        .values(
+            username=create_user_request.username,
+            hashed_password=hashed_password
+        )
+        .returning(User)
     )
-    
-    db.add(create_user_model)
-    db.commit()
-    db.refresh(create_user_model)
+    create_user_model = result.scalar_one()
+    await db.commit()
+    invalidate_cached_user(create_user_model.id)
     return create_user_model
 
 
@@ -143,7 +190,7 @@ async def login_for_access_token(
 
     Args:
         form_data (OAuth2PasswordRequestForm): The form data containing username and password
-        db (Session): SQLAlchemy database session object
+        db (AsyncSession): SQLAlchemy async database session object
 
     Returns:
         Token: The JWT token response model
@@ -151,7 +198,7 @@ async def login_for_access_token(
     Raises:
         HTTPException: If authentication fails
     """
-    user = authenticate_user(form_data.username, form_data.password, db)
+    user = await authenticate_user(form_data.username, form_data.password, db)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -8,9 +8,11 @@ and are associated with the currently authenticated user.
 
 from typing import List, Optional
 from pydantic import BaseModel
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import delete, insert, select
 
-from app.models import Workout
+from app.models import Workout, workout_routine_association
 from app.deps import db_dependency, user_dependency
 
 router = APIRouter(
@@ -63,6 +65,39 @@ class WorkoutResponse(WorkoutBase):
         """Pydantic configuration for the response model."""
         from_attributes = True
 
+class WorkoutPage(BaseModel):
+    """
+    Model for a page of workouts.
+
+    Attributes:
+        items (List[WorkoutResponse]): Workouts on this page, ordered by ID
+        next_cursor (Optional[int]): Cursor for the next page, or None when
+            this is the last page
+    """
+    items: List[WorkoutResponse]
+    next_cursor: Optional[int] = None
+
+
+def workout_to_dict(workout: Workout) -> dict:
+    """
+    Convert a stored workout into a WorkoutResponse-shaped dictionary.
+
+    Rows coming back from the database are already valid, so the routes
+    return them through ORJSONResponse directly. Returning a Response skips
+    FastAPI's second validation pass against the response_model, which is
+    still declared on each route for the OpenAPI schema.
+
+    Args:
+        workout (Workout): Workout ORM instance loaded from the database
+
+    Returns:
+        dict: Workout fields matching WorkoutResponse
+    """
+    return {
+        field: getattr(workout, field)
+        for field in WorkoutResponse.model_fields
+    }
+
 
 @router.get("/{workout_id}", response_model=WorkoutResponse)
 async def get_workout(
@@ -78,7 +113,7 @@ async def get_workout(
 
     Args:
         workout_id (int): The ID of the workout to retrieve
-        db (Session): Database session dependency
+        db (AsyncSession): Database session dependency
         user (dict): Current authenticated user information
 
     Returns:
@@ -87,38 +122,61 @@ async def get_workout(
     Raises:
         HTTPException: 404 if workout not found or doesn't belong to user
     """
-    workout = db.query(Workout).filter(
-        Workout.id == workout_id,
-        Workout.user_id == user["id"]
-    ).first()
+    result = await db.execute(
+        select(Workout).where(
+            Workout.id == workout_id,
+            Workout.user_id == user["id"]
+        )
+    )
+    workout = result.scalars().first()
     
     if not workout:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Workout not found"
         )
-    return workout
+    return ORJSONResponse(workout_to_dict(workout))
 
 
-@router.get("/", response_model=List[WorkoutResponse])
+@router.get("/", response_model=WorkoutPage)
 async def get_workouts(
     db: db_dependency,
-    user: user_dependency
+    user: user_dependency,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[int] = Query(None),
 ):
     """
-    Retrieve all workouts for the authenticated user.
+    Retrieve a page of workouts for the authenticated user.
 
-    This endpoint fetches all workouts associated with the currently
-    authenticated user.
+    This endpoint fetches workouts associated with the currently
+    authenticated user in ascending ID order. Pass the returned next_cursor
+    as cursor to fetch the following page.
 
     Args:
-        db (Session): Database session dependency
+        db (AsyncSession): Database session dependency
         user (dict): Current authenticated user information
+        limit (int): Maximum number of workouts to return (1-500)
+        cursor (Optional[int]): Return only workouts with an ID above this
 
     Returns:
-        List[WorkoutResponse]: List of workouts belonging to the user
+        WorkoutPage: Workouts on this page and the cursor for the next one
     """
-    return db.query(Workout).filter(Workout.user_id == user["id"]).all()
+    query = select(
+        Workout.id,
+        Workout.name,
+        Workout.description,
+        Workout.duration,
+        Workout.date,
+        Workout.user_id,
+    ).where(Workout.user_id == user["id"])
+    if cursor is not None:
+        query = query.where(Workout.id > cursor)
+
+    # Plain column rows skip ORM instance hydration and identity-map work
+    result = await db.execute(query.order_by(Workout.id).limit(limit))
+    items = [dict(row) for row in result.mappings()]
+    next_cursor = items[-1]["id"] if len(items) == limit else None
+    return ORJSONResponse({"items": items, "next_cursor": next_cursor})
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=WorkoutResponse)
@@ -135,17 +193,23 @@ async def create_workout(
 
     Args:
         workout (WorkoutCreate): The workout data to create
-        db (Session): Database session dependency
+        db (AsyncSession): Database session dependency
         user (dict): Current authenticated user information
 
     Returns:
         WorkoutResponse: The created workout details
     """
-    db_workout = Workout(**workout.model_dump(), user_id=user["id"])
-    db.add(db_workout)
-    db.commit()
-    db.refresh(db_workout)
-    return db_workout
+    # INSERT ... RETURNING hands back the stored row without a refresh query
+    result = await db.execute(
+        insert(Workout)
+        .values(**workout.model_dump(), user_id=user["id"])
+        .returning(Workout)
+    )
+    db_workout = result.scalar_one()
+    await db.commit()
+    return ORJSONResponse(
+        workout_to_dict(db_workout), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.delete("/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -158,27 +222,42 @@ async def delete_workout(
     Delete a specific workout.
 
     This endpoint deletes a workout by its ID. The workout must belong to
-    the authenticated user.
+    the authenticated user. Ownership check and deletion happen in a single
+    DELETE ... RETURNING statement instead of loading the workout first,
+    after the workout's routine links are removed.
 
     Args:
         workout_id (int): The ID of the workout to delete
-        db (Session): Database session dependency
+        db (AsyncSession): Database session dependency
         user (dict): Current authenticated user information
 
     Raises:
         HTTPException: 404 if workout not found or doesn't belong to user
     """
-    workout = db.query(Workout).filter(
+    owned_workout = select(Workout.id).where(
         Workout.id == workout_id,
         Workout.user_id == user["id"]
-    ).first()
+    )
+    # A bulk DELETE bypasses the ORM, so clear routine links explicitly;
+    # they go first so enforced foreign keys never see a dangling link
+    await db.execute(
+        delete(workout_routine_association).where(
+            workout_routine_association.c.workout_id.in_(owned_workout)
+        )
+    )
+    result = await db.execute(
+        delete(Workout).where(
+            Workout.id == workout_id,
+            Workout.user_id == user["id"]
+        ).returning(Workout.id)
+    )
+    deleted_id = result.scalar_one_or_none()
     
-    if not workout:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Workout not found"
         )
     
-    db.delete(workout)
-    db.commit()
+    await db.commit()
 